@@ -2,7 +2,23 @@
 import math
 import time
 import random
-from othello_game import OthelloGame
+from othello_game import OthelloGame, CORNERS
+from stability import count_stable_discs, stability_bounds
+
+# Profondeur restante minimale pour tenter la coupure par stabilité (son coût doit être amorti)
+STABILITY_CUTOFF_MIN_DEPTH = 2
+# Profondeur restante minimale pour ordonner les coups par mobilité adverse
+MOBILITY_ORDER_MIN_DEPTH = 2
+# ProbCut : profondeur restante -> (profondeur réduite, pente, ordonnée, écart-type),
+# régression profonde ~ pente * réduite + ordonnée ajustée par probcut.py sur des valeurs
+# vues du camp au trait ; elle ne vaut donc qu'aux nœuds MAX où l'IA a le trait
+# (pour MediumAI en profondeur 4 : 2 demi-coups restants, d'où le couple 2 -> 0)
+MEDIUM_PROBCUT_PARAMS = {2: (0, 1.016, 4.51, 16.92), 3: (1, 1.036, -2.1, 14.71), 4: (2, 1.107, 1.34, 12.79)}
+HARD_PROBCUT_PARAMS = {3: (1, 1.04, -1.23, 12.11), 4: (2, 1.056, 0.52, 10.75), 5: (3, 1.052, -0.1, 8.21)}
+# Profondeur restante minimale pour consulter/alimenter le cache disque (coût d'accès ~0,1 ms)
+DISK_CACHE_MIN_DEPTH = 3
+# À incrémenter à chaque changement de evaluate_advanced/evaluate_stability : invalide le cache disque
+HARD_EVAL_VERSION = 1
 
 #  Classe de base
 class AI:
@@ -18,42 +34,48 @@ class AI:
 
     def get_move(self, game):
         raise NotImplementedError("À implémenter dans les sous-classes")
+
+    def proven_outcome(self, game):
+        """+1 si les pions stables garantissent la victoire, -1 la défaite, 0 sinon."""
+        discs = game.features.discs
+        # Une borne décisive exige plus de 32 pions stables, donc plus de 32 pions : test gratuit
+        if discs['B'] <= 32 and discs['W'] <= 32:
+            return 0
+        lower, upper = stability_bounds(game, self.player)
+        if lower > 0:
+            return 1
+        if upper < 0:
+            return -1
+        return 0
+
+    def opponent_mobility(self, game, child):
+        """Nombre de coups laissés à l'adversaire après le coup (0 s'il doit passer)."""
+        if child.game_over or child.current_player == game.current_player:
+            return 0
+        return len(child.get_valid_moves())
 #  Fonctions d'évaluation partagées
+# Les termes dépendant du plateau sont lus dans `game.features` (tenus à jour à chaque coup).
 def evaluate_simple(game: OthelloGame, player: str) -> float:
     """Évaluation basique: différence de pions, contrôle des coins et des bords."""
     opponent = 'W' if player == 'B' else 'B'
-    board = game.board
+    f = game.features
     score = 0.0
     
     # Différence basique de pions
-    p_count = sum(row.count(player) for row in board)
-    o_count = sum(row.count(opponent) for row in board)
-    score += (p_count - o_count)
+    score += f.discs[player] - f.discs[opponent]
     
     # Occupation des coins (+25 chacun, -25 pour l'adversaire)
-    corners = [(0, 0), (0, 7), (7, 0), (7, 7)]
-    for r, c in corners:
-        if board[r][c] == player:
-            score += 25
-        elif board[r][c] == opponent:
-            score -= 25
+    score += 25 * (f.corners[player] - f.corners[opponent])
     
     # Pions sur les bords (+5 chacun, -5 pour l'adversaire)
-    edges = []
-    for i in range(1, 7):
-        edges.extend([(0, i), (7, i), (i, 0), (i, 7)])
-    
-    for r, c in edges:
-        if board[r][c] == player:
-            score += 5
-        elif board[r][c] == opponent:
-            score -= 5
+    score += 5 * (f.edges[player] - f.edges[opponent])
     
     return score
 def evaluate_advanced(game: OthelloGame, player: str) -> float:
     """Évaluation avancée avec mobilité, stabilité et conscience de fin de partie."""
     opponent = 'W' if player == 'B' else 'B'
     board = game.board
+    f = game.features
     
     # Commencer par l'évaluation de base
     score = evaluate_simple(game, player)
@@ -63,48 +85,19 @@ def evaluate_advanced(game: OthelloGame, player: str) -> float:
     o_mobility = len(game.get_valid_moves(opponent))
     score += 2 * (p_mobility - o_mobility)
     
-    # Mobilité potentielle (cases frontières)
-    p_frontier, o_frontier = 0, 0
-    for r in range(8):
-        for c in range(8):
-            if board[r][c] == ' ':
-                # Compter les pions adjacents
-                for dr in [-1, 0, 1]:
-                    for dc in [-1, 0, 1]:
-                        if dr == 0 and dc == 0:
-                            continue
-                        nr, nc = r + dr, c + dc
-                        if game.is_on_board(nr, nc):
-                            if board[nr][nc] == player:
-                                p_frontier += 1
-                            elif board[nr][nc] == opponent:
-                                o_frontier += 1
-    
-    score += (o_frontier - p_frontier)  # Moins de pions frontières est mieux
+    # Mobilité potentielle (paires pion / case vide adjacente)
+    score += f.frontier[opponent] - f.frontier[player]  # Moins de pions frontières est mieux
     
     # Estimation de stabilité (les coins propagent la stabilité)
-    # Pénalité pour les cases X (-15)
-    x_squares = [(0, 1), (1, 0), (1, 1), (0, 6), (1, 6), (1, 7),
-                (6, 0), (6, 1), (7, 1), (6, 6), (6, 7), (7, 6)]
-    
-    for r, c in x_squares:
-        if board[r][c] == player:
-            # Pénaliser la case X seulement si le coin adjacent est vide
-            if (r <= 1 and c <= 1 and board[0][0] == ' ') or \
-               (r <= 1 and c >= 6 and board[0][7] == ' ') or \
-               (r >= 6 and c <= 1 and board[7][0] == ' ') or \
-               (r >= 6 and c >= 6 and board[7][7] == ' '):
-                score -= 15
-        elif board[r][c] == opponent:
-            # Une case X adverse est bonne pour nous (si le coin est vide)
-            if (r <= 1 and c <= 1 and board[0][0] == ' ') or \
-               (r <= 1 and c >= 6 and board[0][7] == ' ') or \
-               (r >= 6 and c <= 1 and board[7][0] == ' ') or \
-               (r >= 6 and c >= 6 and board[7][7] == ' '):
-                score += 15
+    # Pénalité pour les cases X (-15) seulement si le coin adjacent est vide,
+    # une case X adverse est bonne pour nous (+15)
+    p_x, o_x = f.x_squares[player], f.x_squares[opponent]
+    for i, (r, c) in enumerate(CORNERS):
+        if board[r][c] == ' ':
+            score += 15 * (o_x[i] - p_x[i])
     
     # Bonus de parité pour le dernier coup quand ≤ 8 cases vides (+10)
-    empty_count = sum(row.count(' ') for row in board)
+    empty_count = 64 - f.discs[player] - f.discs[opponent]
     if empty_count <= 8:
         # S'il y a un nombre impair de cases vides et c'est notre tour,
         # on fera le dernier coup (bon)
@@ -116,6 +109,10 @@ def evaluate_advanced(game: OthelloGame, player: str) -> float:
             score += 10
     
     return score
+def evaluate_stability(game: OthelloGame, player: str) -> float:
+    """Terme de stabilité: +10 par pion stable, -10 par pion stable adverse."""
+    black, white = count_stable_discs(game.board)
+    return 10.0 * (black - white if player == 'B' else white - black)
 #  IA Facile (profondeur 1, heuristique simple)
 class EasyAI(AI):
     def __init__(self, player):
@@ -177,35 +174,79 @@ class MediumAI(AI):
         self.max_depth = 4
         self.time_limit = 10.0
         self.depth_reached = 0
+        self.use_stability_cutoff = True
+        # Recherche sélective (chaque option s'active séparément)
+        self.use_probcut = False
+        self.use_mobility_ordering = False
+        self.probcut_params = dict(MEDIUM_PROBCUT_PARAMS)
+        self.probcut_threshold = 1.5
 
-    def prioritize_moves(self, game, moves):
+    def prioritize_moves(self, game, moves, children=None):
         corners = {(0, 0), (0, 7), (7, 0), (7, 7)}
         edges = {(0, i) for i in range(1, 7)} | {(7, i) for i in range(1, 7)} | {(i, 0) for i in range(1, 7)} | {(i, 7) for i in range(1, 7)}
+        if children is not None:
+            # La mobilité adverse départage les coups d'une même catégorie
+            return sorted(moves, key=lambda mv: (0 if mv in corners else 1 if mv in edges else 2,
+                                                 self.opponent_mobility(game, children[mv])))
         return sorted(moves, key=lambda mv: (0 if mv in corners else 1 if mv in edges else 2))
 
-    def minimax(self, game, depth, α, β, maxi, start_time):
+    def minimax(self, game, depth, α, β, maxi, start_time, horizon=None):
         if time.time() - start_time > self.time_limit:
             return None
+        if horizon is None:
+            horizon = self.max_depth
 
         self.moves_evaluated += 1
         self.depth_reached = max(self.depth_reached, depth)
 
-        if game.game_over or depth == self.max_depth:
+        if game.game_over or depth == horizon:
             return evaluate_simple(game, self.player)
 
+        # Coupure par stabilité : issue déjà acquise, inutile de développer
+        if self.use_stability_cutoff and horizon - depth >= STABILITY_CUTOFF_MIN_DEPTH:
+            outcome = self.proven_outcome(game)
+            if outcome:
+                return 10000 * outcome
+
+        # ProbCut : une recherche réduite prédit-elle une sortie de fenêtre ?
+        if (self.use_probcut and maxi and game.current_player == self.player
+                and horizon - depth in self.probcut_params):
+            shallow, slope, intercept, sigma = self.probcut_params[horizon - depth]
+            margin = self.probcut_threshold * sigma
+            if β < math.inf:
+                bound = (β + margin - intercept) / slope
+                val = self.minimax(game, depth, bound - 1, bound, maxi, start_time, depth + shallow)
+                if val is None: return None  # timeout
+                if val >= bound: return β
+            if α > -math.inf:
+                bound = (α - margin - intercept) / slope
+                val = self.minimax(game, depth, bound, bound + 1, maxi, start_time, depth + shallow)
+                if val is None: return None  # timeout
+                if val <= bound: return α
+
         moves = game.get_valid_moves()
         if not moves:
             g2 = game.clone()
             g2.current_player = 'W' if g2.current_player == 'B' else 'B'
-            return self.minimax(g2, depth, α, β, not maxi, start_time)
+            return self.minimax(g2, depth, α, β, not maxi, start_time, horizon)
 
-        ordered = self.prioritize_moves(game, moves)
+        children = None
+        if self.use_mobility_ordering and horizon - depth >= MOBILITY_ORDER_MIN_DEPTH:
+            children = {}
+            for mv in moves:
+                g2 = game.clone()
+                g2.place_disc(*mv)
+                children[mv] = g2
+        ordered = self.prioritize_moves(game, moves, children)
         best = -math.inf if maxi else math.inf
 
         for mv in ordered:
-            g2 = game.clone()
-            g2.place_disc(*mv)
-            val = self.minimax(g2, depth + 1, α, β, not maxi, start_time)
+            if children:
+                g2 = children[mv]
+            else:
+                g2 = game.clone()
+                g2.place_disc(*mv)
+            val = self.minimax(g2, depth + 1, α, β, not maxi, start_time, horizon)
             if val is None: return None  # timeout
             if maxi:
                 best = max(best, val)
@@ -230,7 +271,7 @@ class MediumAI(AI):
         for mv in self.prioritize_moves(game, valid):
             g2 = game.clone()
             g2.place_disc(*mv)
-            score = self.minimax(g2, 1, -math.inf, math.inf, False, t0)
+            score = self.minimax(g2, 1, best_score, math.inf, False, t0)
             if score is None: break  # timeout
             if score > best_score:
                 best_score, best_mv = score, mv
@@ -246,11 +287,36 @@ class HardAI(AI):
         self.time_limit = 10.0
         self.max_depth = 5
         self.depth_reached = 0
+        self.use_stability_cutoff = True
+        self.use_stability_eval = False  # ajoute evaluate_stability aux feuilles (plus lent)
+        # Recherche sélective (chaque option s'active séparément)
+        self.use_probcut = False
+        self.use_etc = False  # coupures de transposition améliorées
+        self.use_mobility_ordering = False
+        self.probcut_params = dict(HARD_PROBCUT_PARAMS)
+        self.probcut_threshold = 1.5
+        self.probcut_probing = 0  # > 0 pendant une recherche réduite ProbCut : aucune écriture en table
+        self.disk_cache = None  # SearchCache optionnel (search_cache.py), partagé entre sessions
+        self.active_cache = None  # disk_cache s'il est utilisable par la recherche en cours
+
+    def cache_fingerprint(self):
+        """Décrit l'évaluation et les options qui déterminent les valeurs mises en cache disque."""
+        return (f"hard-eval{HARD_EVAL_VERSION}-stabcut{int(self.use_stability_cutoff)}"
+                f"-stabeval{int(self.use_stability_eval)}")
+
+    def select_disk_cache(self):
+        """Le cache disque ne sert qu'aux recherches pleine largeur de la même configuration.
+
+        ProbCut coupe sur des prédictions : ses valeurs ne sont ni lues ni écrites.
+        """
+        usable = (self.disk_cache is not None and not self.use_probcut
+                  and self.disk_cache.fingerprint == self.cache_fingerprint())
+        self.active_cache = self.disk_cache if usable else None
 
     def board_hash(self, game):
         return "".join("".join(r) for r in game.board) + "_" + game.current_player
 
-    def prioritize_moves(self, game, moves, depth):
+    def prioritize_moves(self, game, moves, depth, children=None):
         corners = {(0, 0), (0, 7), (7, 0), (7, 7)}
         x_squares = {(1, 1): (0, 0), (1, 6): (0, 7), (6, 1): (7, 0), (6, 6): (7, 7)}
         scores = []
@@ -262,6 +328,8 @@ class HardAI(AI):
                 s += 800
             if hasattr(self, "history_table"):
                 s += self.history_table.get((r, c, game.current_player), 0)
+            if children is not None:
+                s -= 100 * self.opponent_mobility(game, children[(r, c)])
             scores.append((s, (r, c)))
         return [mv for _, mv in sorted(scores, reverse=True)]
 
@@ -277,24 +345,88 @@ class HardAI(AI):
                 if tt["type"] == "lower" and v > a: a = v
                 if tt["type"] == "upper" and v < b: b = v
                 if a >= b: return v
+        # Cache disque : seulement si la valeur du nœud est bien celle du camp au trait
+        use_disk = (self.active_cache is not None and d >= DISK_CACHE_MIN_DEPTH
+                    and maxing == (game.current_player == self.player))
+        cached_mv = None
+        if use_disk:
+            entry = self.active_cache.probe(game, self.player)
+            if entry:
+                cached_mv = entry["move"]
+                if entry["depth"] >= d:
+                    v = entry["value"]
+                    if entry["type"] == "exact": return v
+                    if entry["type"] == "lower" and v > a: a = v
+                    if entry["type"] == "upper" and v < b: b = v
+                    if a >= b: return v
+        a0, b0 = a, b
         if game.game_over:
             return 10000 if game.winner == self.player else -10000 if game.winner else 0
-        if d == 0: return evaluate_advanced(game, self.player)
+        if d == 0:
+            score = evaluate_advanced(game, self.player)
+            if self.use_stability_eval:
+                score += evaluate_stability(game, self.player)
+            return score
+        # Coupure par stabilité : issue déjà acquise, inutile de développer
+        if self.use_stability_cutoff and d >= STABILITY_CUTOFF_MIN_DEPTH:
+            outcome = self.proven_outcome(game)
+            if outcome:
+                return 10000 * outcome
+        # ProbCut : une recherche réduite prédit-elle une sortie de fenêtre ?
+        if (self.use_probcut and maxing and game.current_player == self.player
+                and d in self.probcut_params):
+            shallow, slope, intercept, sigma = self.probcut_params[d]
+            margin = self.probcut_threshold * sigma
+            if b < math.inf:
+                bound = (b + margin - intercept) / slope
+                self.probcut_probing += 1
+                val = self.minimax(game, shallow, bound - 1, bound, maxing, t0)
+                self.probcut_probing -= 1
+                if val is None: return None
+                if val >= bound: return b
+            if a > -math.inf:
+                bound = (a - margin - intercept) / slope
+                self.probcut_probing += 1
+                val = self.minimax(game, shallow, bound, bound + 1, maxing, t0)
+                self.probcut_probing -= 1
+                if val is None: return None
+                if val <= bound: return a
         moves = game.get_valid_moves()
         if not moves:
             g2 = game.clone()
             g2.current_player = 'W' if g2.current_player == 'B' else 'B'
             return self.minimax(g2, d, a, b, not maxing, t0)
-        best = -math.inf if maxing else math.inf
-        for mv in self.prioritize_moves(game, moves, d):
-            g2 = game.clone(); g2.place_disc(*mv)
+        children = None
+        if d >= MOBILITY_ORDER_MIN_DEPTH and (self.use_etc or self.use_mobility_ordering):
+            children = {}
+            for mv in moves:
+                g2 = game.clone(); g2.place_disc(*mv)
+                children[mv] = g2
+        # ETC : une position fille déjà en table suffit-elle à couper ?
+        if self.use_etc and children and hasattr(self, "transposition_table"):
+            for g2 in children.values():
+                tt = self.transposition_table.get(self.board_hash(g2))
+                if tt and tt["depth"] >= d - 1:
+                    v = tt["value"]
+                    if maxing and v >= b and tt["type"] != "upper": return v
+                    if not maxing and v <= a and tt["type"] != "lower": return v
+        best, best_mv = (-math.inf if maxing else math.inf), None
+        ordering = children if self.use_mobility_ordering else None
+        ordered = self.prioritize_moves(game, moves, d, ordering)
+        if cached_mv in ordered:
+            ordered.remove(cached_mv); ordered.insert(0, cached_mv)
+        for mv in ordered:
+            if children:
+                g2 = children[mv]
+            else:
+                g2 = game.clone(); g2.place_disc(*mv)
             val = self.minimax(g2, d-1, a, b, not maxing, t0)
             if val is None: return None
             if maxing:
-                if val > best: best = val
+                if val > best: best, best_mv = val, mv
                 a = max(a, best)
             else:
-                if val < best: best = val
+                if val < best: best, best_mv = val, mv
                 b = min(b, best)
             if a >= b:
                 if hasattr(self, "killer_moves"):
@@ -303,15 +435,19 @@ class HardAI(AI):
                     k = (mv[0], mv[1], game.current_player)
                     self.history_table[k] = self.history_table.get(k, 0) + 2 ** d
                 break
-        if hasattr(self, "transposition_table"):
-            t = "exact" if a < best < b else "lower" if best >= b else "upper"
+        t = "exact" if a0 < best < b0 else "lower" if best >= b0 else "upper"
+        # Les recherches réduites de ProbCut n'écrasent pas les entrées plus profondes
+        if hasattr(self, "transposition_table") and not self.probcut_probing:
             self.transposition_table[key] = {"value": best, "depth": d, "type": t}
+        if use_disk and not self.probcut_probing:
+            self.active_cache.store(game, self.player, d, t, best, best_mv)
         return best
 
     def get_move(self, game):
         import time
         t0 = time.time()
         self.depth_reached = 0
+        self.select_disk_cache()
         valid = game.get_valid_moves()
         if not valid: print(f"[Hard AI] Profondeur max atteinte: {self.depth_reached}"); return None
         if len(valid) == 1: print(f"[Hard AI] Profondeur max atteinte: {self.depth_reached}"); return valid[0]
@@ -319,16 +455,33 @@ class HardAI(AI):
         self.transposition_table = {}; self.killer_moves = {}; self.history_table = {}
         best_mv, best_score = None, -math.inf
 
+        # Amorçage par le cache disque : résultat réutilisé tel quel s'il est assez profond,
+        # sinon son meilleur coup est essayé en premier (et joué si le temps manque)
+        cached = self.active_cache.probe(game, self.player) if self.active_cache is not None else None
+        seed_mv = None
+        if cached and cached["move"] in valid:
+            if cached["type"] == "exact" and cached["depth"] >= self.max_depth:
+                self.depth_reached = cached["depth"]
+                print(f"[Hard AI] Profondeur max atteinte: {self.depth_reached} (cache)")
+                return cached["move"]
+            best_mv = seed_mv = cached["move"]
+
         for d in range(1, self.max_depth + 1):
             if time.time() - t0 > self.time_limit * 0.8: break
             a, b = (best_score - 50, best_score + 50) if d > 1 else (-math.inf, math.inf)
-            move, score = None, -math.inf
-            for mv in self.prioritize_moves(game, valid, d):
+            move, score, completed = None, -math.inf, True
+            ordered = self.prioritize_moves(game, valid, d)
+            if seed_mv:
+                ordered.remove(seed_mv); ordered.insert(0, seed_mv)
+            for mv in ordered:
                 g2 = game.clone(); g2.place_disc(*mv)
-                val = self.minimax(g2, d - 1, a, b, False, t0)
-                if val is None: break
+                val = self.minimax(g2, d - 1, max(a, score), b, False, t0)
+                if val is None: completed = False; break
                 if val > score: move, score = mv, val
             if move: best_mv, best_score = move, score; self.depth_reached = d
+            if completed and move and self.active_cache is not None:
+                t = "exact" if a < score < b else "lower" if score >= b else "upper"
+                self.active_cache.store(game, self.player, d, t, score, move)
             if best_score > 9000: break
         print(f"[Hard AI] Profondeur max atteinte: {self.depth_reached}") # affiche la profondeur max atteinte pour chaque coup
         return best_mv
\ No newline at end of file
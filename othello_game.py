@@ -1,5 +1,103 @@
 # othello_game.py
 
+DIRECTIONS = [(-1,-1),(-1,0),(-1,1),(0,-1),(0,1),(1,-1),(1,0),(1,1)]
+CORNERS = [(0, 0), (0, 7), (7, 0), (7, 7)]
+# Cases X et C regroupées par coin adjacent (même ordre que CORNERS)
+X_SQUARE_GROUPS = [[(0, 1), (1, 0), (1, 1)], [(0, 6), (1, 6), (1, 7)],
+                   [(6, 0), (6, 1), (7, 1)], [(6, 6), (6, 7), (7, 6)]]
+# Voisins sur le plateau de chaque case, précalculés
+NEIGHBOURS = [[[(r + dr, c + dc) for dr, dc in DIRECTIONS
+                if 0 <= r + dr < 8 and 0 <= c + dc < 8]
+               for c in range(8)] for r in range(8)]
+# Type de chaque case : 'corner', 'edge' (bord hors coin) ou None
+SQUARE_KIND = [['corner' if (r, c) in CORNERS else
+                'edge' if r in (0, 7) or c in (0, 7) else None
+                for c in range(8)] for r in range(8)]
+# Indice du coin associé à chaque case X/C, -1 sinon
+X_GROUP = [[-1] * 8 for _ in range(8)]
+for _i, _group in enumerate(X_SQUARE_GROUPS):
+    for _r, _c in _group:
+        X_GROUP[_r][_c] = _i
+
+
+class BoardFeatures:
+    """Compteurs d'évaluation (pions, coins, bords, frontière, cases X) tenus à jour coup par coup.
+
+    La frontière d'une couleur est le nombre de paires (pion, case vide adjacente) :
+    c'est exactement la somme calculée case vide par case vide dans `evaluate_advanced`.
+    Chaque mise à jour coûte O(nombre de pions retournés).
+    """
+    def __init__(self):
+        self.discs = {'B': 0, 'W': 0}
+        self.corners = {'B': 0, 'W': 0}
+        self.edges = {'B': 0, 'W': 0}
+        self.frontier = {'B': 0, 'W': 0}
+        self.x_squares = {'B': [0, 0, 0, 0], 'W': [0, 0, 0, 0]}
+
+    def recompute(self, board):
+        """Recalcule tous les compteurs à partir du plateau complet."""
+        self.__init__()
+        for r in range(8):
+            for c in range(8):
+                color = board[r][c]
+                if color == ' ':
+                    continue
+                self._count_square(r, c, color, 1)
+                self.frontier[color] += sum(1 for nr, nc in NEIGHBOURS[r][c]
+                                            if board[nr][nc] == ' ')
+
+    def copy(self):
+        """Copie indépendante des compteurs."""
+        copy = BoardFeatures.__new__(BoardFeatures)
+        copy.discs = self.discs.copy()
+        copy.corners = self.corners.copy()
+        copy.edges = self.edges.copy()
+        copy.frontier = self.frontier.copy()
+        copy.x_squares = {'B': self.x_squares['B'][:], 'W': self.x_squares['W'][:]}
+        return copy
+
+    def _count_square(self, r, c, color, sign):
+        self.discs[color] += sign
+        kind = SQUARE_KIND[r][c]
+        if kind == 'corner':
+            self.corners[color] += sign
+        elif kind == 'edge':
+            self.edges[color] += sign
+        group = X_GROUP[r][c]
+        if group >= 0:
+            self.x_squares[color][group] += sign
+
+    def _update(self, board, row, col, flips, player, sign):
+        # `board` est l'état AVANT le coup : (row,col) vide, `flips` à l'adversaire
+        opponent = 'W' if player == 'B' else 'B'
+        frontier = self.frontier
+        empty_around = 0
+        for nr, nc in NEIGHBOURS[row][col]:
+            color = board[nr][nc]
+            if color == ' ':
+                empty_around += 1
+            else:
+                frontier[color] -= sign  # (row,col) cesse d'être une case vide voisine
+        frontier[player] += sign * empty_around
+        self._count_square(row, col, player, sign)
+        for r, c in flips:
+            empties = sum(1 for nr, nc in NEIGHBOURS[r][c] if board[nr][nc] == ' ')
+            if abs(r - row) <= 1 and abs(c - col) <= 1:
+                empties -= 1  # la case jouée n'est plus vide après le coup
+            frontier[opponent] -= sign * empties
+            frontier[player] += sign * empties
+            self._count_square(r, c, opponent, -sign)
+            self._count_square(r, c, player, sign)
+
+    def apply_move(self, board, row, col, flips, player):
+        """Met à jour les compteurs pour un coup ; à appeler AVANT de modifier le plateau."""
+        self._update(board, row, col, flips, player, 1)
+
+    def undo_move(self, board, row, col, flips, player):
+        """Annule un coup ; à appeler APRÈS avoir restauré le plateau."""
+        self._update(board, row, col, flips, player, -1)
+
+
 class OthelloGame:
     """Implémentation du jeu Othello/Reversi avec un plateau de 8×8."""
     def __init__(self):
@@ -15,6 +113,9 @@ class OthelloGame:
         self.game_over = False
         self.winner = None
         self.last_move = None
+        self.history = []
+        self.features = BoardFeatures()
+        self.features.recompute(self.board)
     
     def get_opponent(self, player=None):
         """Renvoie l'adversaire du joueur donné."""
@@ -36,7 +137,7 @@ class OthelloGame:
         
         opponent = self.get_opponent(player)
         # Vérifier les 8 directions
-        for dr, dc in [(-1,-1),(-1,0),(-1,1),(0,-1),(0,1),(1,-1),(1,0),(1,1)]:
+        for dr, dc in DIRECTIONS:
             r, c = row + dr, col + dc
             # Le premier adjacent doit être un adversaire
             if not (self.is_on_board(r, c) and self.board[r][c] == opponent):
@@ -60,7 +161,7 @@ class OthelloGame:
         opponent = self.get_opponent(player)
         flipped = []
         # Vérifier les 8 directions
-        for dr, dc in [(-1,-1),(-1,0),(-1,1),(0,-1),(0,1),(1,-1),(1,0),(1,1)]:
+        for dr, dc in DIRECTIONS:
             r, c = row + dr, col + dc
             to_flip = []
             # Collecter les pions adverses
@@ -78,6 +179,9 @@ class OthelloGame:
             return False
         
         flips = self.get_flipped_discs(row, col)
+        self.history.append((row, col, flips, self.current_player,
+                             self.game_over, self.winner, self.last_move))
+        self.features.apply_move(self.board, row, col, flips, self.current_player)
         # Placer et retourner
         self.board[row][col] = self.current_player
         for r, c in flips:
@@ -96,6 +200,22 @@ class OthelloGame:
                     self.check_game_state()
         return True
     
+    def undo_move(self):
+        """Annule le dernier coup joué par `place_disc` (plateau, tour, état, compteurs)."""
+        if not self.history:
+            return False
+        row, col, flips, player, game_over, winner, last_move = self.history.pop()
+        opponent = self.get_opponent(player)
+        self.board[row][col] = ' '
+        for r, c in flips:
+            self.board[r][c] = opponent
+        self.features.undo_move(self.board, row, col, flips, player)
+        self.current_player = player
+        self.game_over = game_over
+        self.winner = winner
+        self.last_move = last_move
+        return True
+    
     def get_valid_moves(self, player=None):
         """Renvoie la liste des coups légaux (row,col) pour le joueur donné."""
         if player is None:
@@ -130,13 +250,15 @@ class OthelloGame:
                 sum(row.count('W') for row in self.board))
     
     def clone(self):
-        """Copie profonde de l'état du jeu."""
-        copy = OthelloGame()
+        """Copie profonde de l'état du jeu (l'historique d'annulation n'est pas copié)."""
+        copy = OthelloGame.__new__(OthelloGame)  # évite le reset/recalcul inutile
         copy.board = [row[:] for row in self.board]
         copy.current_player = self.current_player
         copy.game_over = self.game_over
         copy.winner = self.winner
         copy.last_move = self.last_move
+        copy.history = []
+        copy.features = self.features.copy()
         return copy
     
     def print_board(self):
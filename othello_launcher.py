@@ -4,6 +4,10 @@ import sys
 from othello_game import human_vs_human, human_vs_ai
 from ai_strategies import EasyAI, MediumAI, HardAI
 from tournament import Tournament
+from search_cache import SearchCache, DEFAULT_CACHE_FILE
+
+# Cache disque des recherches de Hard AI, conservé d'une session à l'autre (None pour désactiver)
+USE_DISK_CACHE = True
 
 
 def main_menu():
@@ -16,6 +20,8 @@ def main_menu():
         "5) Tournoi d'IA",
         "6) Quitter"
     ]
+    # Ouvert paresseusement : le démarrage reste instantané
+    cache = SearchCache(DEFAULT_CACHE_FILE, fingerprint=HardAI('W').cache_fingerprint()) if USE_DISK_CACHE else None
 
     while True:
         print("\n=== Othello AI ===")
@@ -30,14 +36,18 @@ def main_menu():
         elif choix == '3':
             human_vs_ai(MediumAI('W'))
         elif choix == '4':
-            human_vs_ai(HardAI('W'))
+            ai = HardAI('W')
+            ai.disk_cache = cache
+            human_vs_ai(ai)
         elif choix == '5':
             nb = input("Nombre de parties par affrontement (défaut 50) : ").strip()
             nb = int(nb) if nb.isdigit() and int(nb) > 0 else 50
             fichier_resultats = input("Nom du fichier pour enregistrer les résultats (défaut: 'resultats_tournoi.txt') : ").strip()
             fichier_resultats = fichier_resultats if fichier_resultats else "resultats_tournoi.txt"
-            Tournament().full_tournament(nb, fichier_resultats)
+            Tournament(disk_cache=cache).full_tournament(nb, fichier_resultats)
         elif choix == '6':
+            if cache is not None:
+                cache.close()
             print("Au revoir !")
             sys.exit()
         else:
@@ -0,0 +1,100 @@
+# probcut.py — Journalise des recherches réduites/profondes et ajuste les paramètres ProbCut
+
+import csv
+import math
+import random
+import time
+from othello_game import OthelloGame
+from ai_strategies import MediumAI, HardAI
+
+# Couples (profondeur profonde, profondeur réduite) journalisés par défaut
+DEPTH_PAIRS = [(3, 1), (4, 2)]
+MEDIUM_DEPTH_PAIRS = [(2, 0)] + DEPTH_PAIRS
+HARD_DEPTH_PAIRS = DEPTH_PAIRS + [(5, 3)]
+
+
+def sample_positions(count: int, seed: int = 0, min_empty: int = 12, max_empty: int = 50):
+    """Tire `count` positions de milieu de partie issues de parties aléatoires."""
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        game = OthelloGame()
+        target = rng.randint(64 - max_empty, 64 - min_empty)
+        while not game.game_over and sum(game.get_score()) < target:
+            moves = game.get_valid_moves()
+            if not moves:
+                game.current_player = game.get_opponent()
+                continue
+            game.place_disc(*rng.choice(moves))
+        if not game.game_over and game.get_valid_moves():
+            positions.append(game)
+    return positions
+
+
+def search_value(ai, game, depth):
+    """Valeur minimax pleine fenêtre de `game` à `depth` demi-coups, du point de vue du trait."""
+    ai.player = game.current_player
+    ai.opponent = game.get_opponent()
+    ai.use_probcut = False
+    ai.time_limit = math.inf
+    if isinstance(ai, MediumAI):
+        return ai.minimax(game, 0, -math.inf, math.inf, True, time.time(), depth)
+    return ai.minimax(game, depth, -math.inf, math.inf, True, time.time())
+
+
+def log_searches(ai_class, positions, log_file: str, pairs=DEPTH_PAIRS):
+    """Ajoute au fichier CSV une ligne (profonde, réduite, valeur réduite, valeur profonde) par recherche."""
+    with open(log_file, 'a', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        for game in positions:
+            for deep, shallow in pairs:
+                ai = ai_class(game.current_player)
+                v_shallow = search_value(ai, game, shallow)
+                v_deep = search_value(ai, game, deep)
+                writer.writerow([deep, shallow, v_shallow, v_deep])
+
+
+def load_samples(log_file: str):
+    """Relit le journal : liste de (profonde, réduite, valeur réduite, valeur profonde)."""
+    with open(log_file, newline='', encoding='utf-8') as f:
+        return [(int(d), int(s), float(vs), float(vd)) for d, s, vs, vd in csv.reader(f)]
+
+
+def fit_probcut(samples):
+    """Régression linéaire valeur profonde ~ pente * valeur réduite + ordonnée, par profondeur.
+
+    Les positions décidées (|valeur| ≥ 9000) sont écartées. Renvoie
+    {profondeur: (réduite, pente, ordonnée, écart-type des résidus)}.
+    """
+    groups = {}
+    for deep, shallow, v_shallow, v_deep in samples:
+        if abs(v_shallow) < 9000 and abs(v_deep) < 9000:
+            groups.setdefault((deep, shallow), []).append((v_shallow, v_deep))
+    params = {}
+    for (deep, shallow), points in sorted(groups.items()):
+        n = len(points)
+        if n < 10:
+            continue
+        mx = sum(x for x, _ in points) / n
+        my = sum(y for _, y in points) / n
+        sxx = sum((x - mx) ** 2 for x, _ in points)
+        sxy = sum((x - mx) * (y - my) for x, y in points)
+        if sxx == 0 or sxy <= 0:
+            continue
+        slope = sxy / sxx
+        intercept = my - slope * mx
+        sigma = math.sqrt(sum((y - slope * x - intercept) ** 2 for x, y in points) / (n - 2))
+        params[deep] = (shallow, round(slope, 3), round(intercept, 2), round(sigma, 2))
+    return params
+
+
+if __name__ == '__main__':
+    try:
+        n = int(input("Nombre de positions à journaliser [défaut 200] : ") or 200)
+    except ValueError:
+        n = 200
+    positions = sample_positions(n)
+    for cls, log_file, pairs in ((MediumAI, "probcut_medium.csv", MEDIUM_DEPTH_PAIRS),
+                                 (HardAI, "probcut_hard.csv", HARD_DEPTH_PAIRS)):
+        log_searches(cls, positions, log_file, pairs)
+        print(f"{cls.__name__}: {fit_probcut(load_samples(log_file))}")
@@ -0,0 +1,233 @@
+# search_cache.py — Cache disque des résultats de recherche, partagé entre sessions et processus
+
+import mmap
+import os
+import struct
+import zlib
+
+try:
+    import fcntl  # verrou inter-processus pour les écritures (absent sous Windows)
+except ImportError:
+    fcntl = None
+
+DEFAULT_CACHE_FILE = "othello_cache.bin"
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+BUCKET_SIZE = 4  # enregistrements par seau
+
+# En-tête : signature, version, empreinte de la configuration de recherche, nombre d'enregistrements
+HEADER = struct.Struct('<8sIII')
+MAGIC, VERSION = b'OTHCACHE', 2
+# Enregistrement : pions noirs, pions blancs, trait/point de vue, profondeur, borne, coup,
+# score, somme de contrôle (CRC32 des champs précédents)
+RECORD = struct.Struct('<QQBBBBdI')
+BOUNDS = ["exact", "lower", "upper"]
+NO_MOVE = 255
+
+# Les 8 symétries du plateau : case (r,c) -> case transformée
+_TRANSFORMS = [
+    lambda r, c: (r, c), lambda r, c: (c, 7 - r), lambda r, c: (7 - r, 7 - c), lambda r, c: (7 - c, r),
+    lambda r, c: (r, 7 - c), lambda r, c: (7 - r, c), lambda r, c: (c, r), lambda r, c: (7 - c, 7 - r),
+]
+SYMMETRIES = [[8 * t(sq // 8, sq % 8)[0] + t(sq // 8, sq % 8)[1] for sq in range(64)] for t in _TRANSFORMS]
+INVERSES = [[0] * 64 for _ in SYMMETRIES]
+for _s, _sym in enumerate(SYMMETRIES):
+    for _sq, _target in enumerate(_sym):
+        INVERSES[_s][_target] = _sq
+
+
+def canonical_key(game, player):
+    """Renvoie (noirs, blancs, code, symétrie) de la forme canonique de la position.
+
+    La forme canonique est la plus petite des 8 images symétriques ; `code` mêle
+    le trait et le point de vue (`player`) des scores enregistrés.
+    """
+    blacks, whites = [], []
+    for r in range(8):
+        row = game.board[r]
+        for c in range(8):
+            if row[c] == 'B':
+                blacks.append(8 * r + c)
+            elif row[c] == 'W':
+                whites.append(8 * r + c)
+    best = None
+    for s, sym in enumerate(SYMMETRIES):
+        black = 0
+        for sq in blacks:
+            black |= 1 << sym[sq]
+        white = 0
+        for sq in whites:
+            white |= 1 << sym[sq]
+        if best is None or (black, white) < best[:2]:
+            best = (black, white, s)
+    code = (1 if game.current_player == 'B' else 2) | (4 if player == game.current_player else 0)
+    return best[0], best[1], code, best[2]
+
+
+class SearchCache:
+    """Table de hachage sur disque à enregistrements fixes, projetée en mémoire.
+
+    Le fichier est ouvert à la première utilisation ; s'il est inutilisable, le
+    cache se désactive au lieu d'interrompre la partie. Sa taille (plafond) est
+    fixée à la création ; chaque position tombe dans un seau de BUCKET_SIZE
+    enregistrements où l'on remplace l'entrée la moins profonde. L'empreinte
+    (`fingerprint`) décrit l'évaluation et les options qui ont produit les
+    valeurs ; un fichier d'une autre empreinte est reconstruit. Les lectures
+    sont sans verrou : un enregistrement en cours d'écriture par un autre
+    processus échoue au contrôle CRC et compte comme absent.
+    """
+    def __init__(self, path: str = DEFAULT_CACHE_FILE, max_bytes: int = DEFAULT_MAX_BYTES,
+                 fingerprint: str = ""):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.fingerprint = fingerprint
+        self.fingerprint_hash = zlib.crc32(fingerprint.encode('utf-8'))
+        self._file = None
+        self._map = None
+        self.num_buckets = 0
+        self.disabled = False
+
+    def _open(self):
+        """Projette le fichier en mémoire au premier appel ; renvoie False si le cache est inutilisable.
+
+        Un fichier absent, tronqué, d'une autre version ou d'une autre empreinte est reconstruit ; un
+        fichier étranger ou une erreur d'accès désactivent simplement le cache.
+        """
+        if self._map is not None:
+            return True
+        if self.disabled:
+            return False
+        try:
+            for attempt in range(2):
+                try:
+                    f = open(self.path, 'r+b')
+                except FileNotFoundError:
+                    f = None
+                if f is not None:
+                    try:
+                        slots = self._validate(f)
+                        if slots:
+                            self._map = mmap.mmap(f.fileno(), HEADER.size + slots * RECORD.size)
+                            self._file = f
+                            self.num_buckets = slots // BUCKET_SIZE
+                            return True
+                    except BaseException:
+                        f.close()
+                        raise
+                    f.close()
+                if attempt == 0:
+                    self._rebuild()
+            raise ValueError("fichier invalide après reconstruction")
+        except (OSError, ValueError, struct.error) as e:
+            self.close()
+            self.disabled = True
+            print(f"[Cache] {self.path} inutilisable, recherche sans cache : {e}")
+            return False
+
+    def _validate(self, f):
+        """Nombre d'enregistrements du fichier ouvert, ou None s'il faut le reconstruire."""
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(0)
+        head = f.read(HEADER.size)
+        if not head.startswith(MAGIC[:len(head)]):
+            raise ValueError("ce n'est pas un cache de recherche Othello")
+        if size < HEADER.size:
+            return None  # création interrompue
+        magic, version, fingerprint, slots = HEADER.unpack(head)
+        if version != VERSION or fingerprint != self.fingerprint_hash or slots == 0 or slots % BUCKET_SIZE \
+                or size != HEADER.size + slots * RECORD.size:
+            return None
+        return slots
+
+    def _rebuild(self):
+        """Crée un cache vide à côté puis le substitue atomiquement à l'ancien fichier.
+
+        Les processus qui ont encore l'ancien fichier projeté le gardent intact.
+        """
+        slots = max(self.max_bytes - HEADER.size, 0) // RECORD.size
+        slots = max(slots - slots % BUCKET_SIZE, BUCKET_SIZE)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, VERSION, self.fingerprint_hash, slots))
+                f.truncate(HEADER.size + slots * RECORD.size)
+            os.replace(tmp, self.path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def _lock(self, f):
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock(self, f):
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _bucket_offset(self, black, white, code):
+        h = (black * 0x9E3779B97F4A7C15 ^ white * 0xC2B2AE3D27D4EB4F ^ code) & 0xFFFFFFFFFFFFFFFF
+        return HEADER.size + (h % self.num_buckets) * BUCKET_SIZE * RECORD.size
+
+    def _read(self, offset):
+        """Renvoie l'enregistrement décodé, ou None s'il est vide ou incohérent."""
+        data = self._map[offset:offset + RECORD.size]
+        fields = RECORD.unpack(data)
+        if fields[7] != zlib.crc32(data[:-4]):
+            return None
+        return fields
+
+    def probe(self, game, player):
+        """Cherche la position ; renvoie {"depth", "type", "value", "move"} ou None.
+
+        `value` est du point de vue de `player`, `move` en coordonnées réelles.
+        """
+        if not self._open():
+            return None
+        black, white, code, s = canonical_key(game, player)
+        offset = self._bucket_offset(black, white, code)
+        for i in range(BUCKET_SIZE):
+            rec = self._read(offset + i * RECORD.size)
+            if rec and rec[0] == black and rec[1] == white and rec[2] == code:
+                move = None if rec[5] == NO_MOVE else divmod(INVERSES[s][rec[5]], 8)
+                return {"depth": rec[3], "type": BOUNDS[rec[4]], "value": rec[6], "move": move}
+        return None
+
+    def store(self, game, player, depth, bound_type, value, move=None):
+        """Enregistre un résultat s'il est plus profond que celui déjà connu ; renvoie True si écrit."""
+        if not self._open():
+            return False
+        black, white, code, s = canonical_key(game, player)
+        offset = self._bucket_offset(black, white, code)
+        sq = NO_MOVE if move is None else SYMMETRIES[s][8 * move[0] + move[1]]
+        data = RECORD.pack(black, white, code, min(depth, 255), BOUNDS.index(bound_type), sq, value, 0)
+        data = data[:-4] + struct.pack('<I', zlib.crc32(data[:-4]))
+        self._lock(self._file)
+        try:
+            target, target_depth = None, None
+            for i in range(BUCKET_SIZE):
+                slot = offset + i * RECORD.size
+                rec = self._read(slot)
+                if rec is None:
+                    if target_depth is None or target_depth >= 0:
+                        target, target_depth = slot, -1  # case libre
+                    continue
+                if rec[0] == black and rec[1] == white and rec[2] == code:
+                    if rec[3] >= depth:
+                        return False
+                    target = slot
+                    break
+                if target_depth is None or rec[3] < target_depth:
+                    target, target_depth = slot, rec[3]
+            self._map[target:target + RECORD.size] = data
+        finally:
+            self._unlock(self._file)
+        return True
+
+    def close(self):
+        if self._map is not None:
+            self._map.flush()
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,152 @@
+# stability.py — Tables de stabilité des bords et comptage rapide des pions stables
+
+# Un bord est codé en base 3 sur ses 8 cases : 0 = vide, 1 = Noir, 2 = Blanc
+CELL_CODE = {' ': 0, 'B': 1, 'W': 2}
+POW3 = [3 ** i for i in range(8)]
+
+# Les 4 bords du plateau, chacun comme liste ordonnée de 8 cases
+EDGE_LINES = [
+    [(0, i) for i in range(8)],
+    [(7, i) for i in range(8)],
+    [(i, 0) for i in range(8)],
+    [(i, 7) for i in range(8)],
+]
+# Les 4 axes (horizontal, vertical, diagonale, anti-diagonale)
+AXES = [(0, 1), (1, 0), (1, 1), (1, -1)]
+
+_edge_table = None
+
+
+def _edge_flips(cells, i, color):
+    """Masque des cases retournées sur le bord en jouant `color` en i."""
+    opponent = 3 - color
+    mask = 0
+    for step in (-1, 1):
+        j, run = i + step, 0
+        while 0 <= j < 8 and cells[j] == opponent:
+            run |= 1 << j
+            j += step
+        if 0 <= j < 8 and cells[j] == color:
+            mask |= run
+    return mask
+
+
+def build_edge_table():
+    """Construit la table des pions stables pour les 3^8 configurations d'un bord.
+
+    Un pion est stable s'il garde sa couleur quelle que soit la suite des coups
+    joués sur le bord ; toute case vide peut recevoir un pion de chaque couleur
+    (il peut y être posé par une prise dans une autre direction).
+    """
+    table = [0] * 3 ** 8
+    configs = []
+    for index in range(3 ** 8):
+        cells = [(index // POW3[i]) % 3 for i in range(8)]
+        configs.append((cells.count(0), index, cells))
+    # Les configurations les plus remplies d'abord : leurs successeurs sont déjà connus
+    for _, index, cells in sorted(configs):
+        stable = sum(1 << i for i in range(8) if cells[i])
+        for i in range(8):
+            if cells[i] or not stable:
+                continue
+            for color in (1, 2):
+                flipped = _edge_flips(cells, i, color)
+                child = index + color * POW3[i]
+                for j in range(8):
+                    if flipped >> j & 1:
+                        child += (color - cells[j]) * POW3[j]
+                stable &= table[child] & ~flipped
+        table[index] = stable
+    return table
+
+
+def get_edge_table():
+    """Renvoie la table des bords, construite une seule fois au premier appel."""
+    global _edge_table
+    if _edge_table is None:
+        _edge_table = build_edge_table()
+    return _edge_table
+
+
+def count_stable_discs(board):
+    """Renvoie (stables_noir, stables_blanc).
+
+    Part des pions stables des bords (table précalculée) puis propage : un pion
+    est stable si, sur chacun des 4 axes, sa ligne est pleine ou l'un de ses
+    voisins sur l'axe est le bord du plateau ou un pion stable de même couleur.
+    """
+    table = get_edge_table()
+    stable = [[False] * 8 for _ in range(8)]
+    for line in EDGE_LINES:
+        index = 0
+        for i, (r, c) in enumerate(line):
+            index += CELL_CODE[board[r][c]] * POW3[i]
+        mask = table[index]
+        if mask:
+            for i, (r, c) in enumerate(line):
+                if mask >> i & 1:
+                    stable[r][c] = True
+
+    # Lignes pleines pour chaque axe
+    full_row = [' ' not in board[r] for r in range(8)]
+    full_col = [all(board[r][c] != ' ' for r in range(8)) for c in range(8)]
+    full_diag, full_anti = {}, {}
+    for k in range(-7, 8):
+        full_diag[k] = all(board[r][r - k] != ' ' for r in range(8) if 0 <= r - k < 8)
+    for k in range(15):
+        full_anti[k] = all(board[r][k - r] != ' ' for r in range(8) if 0 <= k - r < 8)
+
+    candidates = [(r, c) for r in range(8) for c in range(8)
+                  if board[r][c] != ' ' and not stable[r][c]]
+    changed = True
+    while changed and candidates:
+        changed = False
+        remaining = []
+        for r, c in candidates:
+            color = board[r][c]
+            ok = True
+            for axis, (dr, dc) in enumerate(AXES):
+                if axis == 0:
+                    full = full_row[r]
+                elif axis == 1:
+                    full = full_col[c]
+                elif axis == 2:
+                    full = full_diag[r - c]
+                else:
+                    full = full_anti[r + c]
+                if full:
+                    continue
+                r1, c1, r2, c2 = r - dr, c - dc, r + dr, c + dc
+                if not (0 <= r1 < 8 and 0 <= c1 < 8) or not (0 <= r2 < 8 and 0 <= c2 < 8):
+                    continue
+                if (stable[r1][c1] and board[r1][c1] == color) or \
+                   (stable[r2][c2] and board[r2][c2] == color):
+                    continue
+                ok = False
+                break
+            if ok:
+                stable[r][c] = True
+                changed = True
+            else:
+                remaining.append((r, c))
+        candidates = remaining
+
+    black = white = 0
+    for r in range(8):
+        for c in range(8):
+            if stable[r][c]:
+                if board[r][c] == 'B':
+                    black += 1
+                else:
+                    white += 1
+    return black, white
+
+
+def stability_bounds(game, player):
+    """Bornes (inférieure, supérieure) de la différence finale de pions pour `player`.
+
+    Les pions stables de chaque camp lui sont acquis jusqu'à la fin de la partie.
+    """
+    black, white = count_stable_discs(game.board)
+    own, other = (black, white) if player == 'B' else (white, black)
+    return 2 * own - 64, 64 - 2 * other
@@ -1,13 +1,15 @@
 # othello_tournament.py — Gère les affrontements entre IA et affiche les résultats
 
 import random
+import time
 from othello_game import OthelloGame
 from ai_strategies import EasyAI, MediumAI, HardAI
 
 class Tournament:
     """Organise les matchs entre IA et collecte les statistiques."""
-    def __init__(self):
+    def __init__(self, disk_cache=None):
         self.results = []
+        self.disk_cache = disk_cache  # SearchCache partagé par les Hard AI du tournoi
 
     def run_match(self, ai1, ai2, num_games: int = 50):
         """Joue `num_games` parties entre `ai1` et `ai2`, en alternant les couleurs."""
@@ -16,7 +18,11 @@ class Tournament:
             ai2.name: 0,
             'draws': 0,
             'disc_diff': {ai1.name: 0, ai2.name: 0},
-            'total_discs': {ai1.name: 0, ai2.name: 0}
+            'total_discs': {ai1.name: 0, ai2.name: 0},
+            'depth_total': {ai1.name: 0, ai2.name: 0},
+            'time_total': {ai1.name: 0.0, ai2.name: 0.0},
+            'nodes_total': {ai1.name: 0, ai2.name: 0},
+            'moves': {ai1.name: 0, ai2.name: 0}
         }
 
         print(f"Match {ai1.name} vs {ai2.name}:")
@@ -39,7 +45,13 @@ class Tournament:
             # Déroulement de la partie
             while not game.game_over:
                 current = players[game.current_player]
+                t0 = time.time()
                 move = current.get_move(game)
+                # Profondeur atteinte et temps par coup, pour comparer les réglages
+                stats['time_total'][current.name] += time.time() - t0
+                stats['depth_total'][current.name] += getattr(current, 'depth_reached', 0)
+                stats['nodes_total'][current.name] += getattr(current, 'moves_evaluated', 0)
+                stats['moves'][current.name] += 1
                 if move is None:
                     # Passage de tour
                     game.current_player = game.get_opponent()
@@ -75,6 +87,7 @@ class Tournament:
     def full_tournament(self, num_games: int = 50, output_file: str = "resultats_tournoi.txt"):
         """Lance le tournoi Easy vs Medium vs Hard et affiche un résumé clair, enregistre les résultats dans un fichier."""
         ais = [EasyAI('B'), MediumAI('B'), HardAI('B')]
+        ais[2].disk_cache = self.disk_cache
         print("\n=== Tournoi Othello IA ===")
         print(f"Parties par affrontement : {num_games}\n")
 
@@ -116,6 +129,53 @@ class Tournament:
 
         return self.results
 
+    def selective_comparison(self, num_games: int = 10, time_limit: float = 1.0, max_depth: int = 8,
+                             output_file: str = "resultats_selectif.txt"):
+        """Compare à temps égal chaque option de recherche sélective à l'IA de référence.
+
+        Pour MediumAI (profondeur fixe) le gain se lit dans le temps et les nœuds
+        par coup, pour HardAI (approfondissement itératif) dans la profondeur atteinte.
+        """
+        options = {
+            MediumAI: [('ProbCut', ['use_probcut']),
+                       ('Mobilité', ['use_mobility_ordering']),
+                       ('Tout', ['use_probcut', 'use_mobility_ordering'])],
+            HardAI: [('ProbCut', ['use_probcut']),
+                     ('ETC', ['use_etc']),
+                     ('Mobilité', ['use_mobility_ordering']),
+                     ('Tout', ['use_probcut', 'use_etc', 'use_mobility_ordering'])],
+        }
+        print("\n=== Recherche sélective à temps égal ===")
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(f"=== Recherche sélective ({time_limit:.1f}s par coup) ===\n\n")
+            for cls, variants in options.items():
+                for label, flags in variants:
+                    base, variant = cls('B'), cls('B')
+                    for ai in (base, variant):
+                        ai.time_limit = time_limit
+                        if cls is HardAI:
+                            ai.max_depth = max_depth
+                    for flag in flags:
+                        setattr(variant, flag, True)
+                    variant.name = f"{base.name} ({label})"
+                    s = self.run_match(base, variant, num_games)['stats']
+
+                    lines = [f"--- {base.name} vs {variant.name} ---",
+                             f"Victoires: {s[base.name]} / {s[variant.name]}, Nuls: {s['draws']}, "
+                             f"ΔDisques ({variant.name}): {s['disc_diff'][variant.name]:+d}"]
+                    for ai in (base, variant):
+                        n = max(s['moves'][ai.name], 1)
+                        if cls is MediumAI:
+                            lines.append(f"{ai.name}: {s['nodes_total'][ai.name] / n:.0f} nœuds/coup, "
+                                         f"temps moyen {s['time_total'][ai.name] / n:.3f}s/coup")
+                        else:
+                            lines.append(f"{ai.name}: profondeur moyenne {s['depth_total'][ai.name] / n:.2f}, "
+                                         f"temps moyen {s['time_total'][ai.name] / n:.2f}s/coup")
+                    result_str = "\n".join(lines) + "\n"
+                    print(result_str)
+                    f.write(result_str + "\n")
+        return self.results
+
 
 if __name__ == '__main__':
     try:
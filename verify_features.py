@@ -0,0 +1,124 @@
+# verify_features.py — Vérifie les compteurs incrémentaux (BoardFeatures) contre un recalcul complet
+
+import random
+import sys
+import time
+from othello_game import OthelloGame, BoardFeatures
+from ai_strategies import evaluate_simple, evaluate_advanced
+
+
+#  Évaluations de référence, calculées sur le plateau complet (versions d'origine)
+def reference_simple(game: OthelloGame, player: str) -> float:
+    """Différence de pions, coins (±25) et bords (±5) comptés case par case."""
+    opponent = 'W' if player == 'B' else 'B'
+    board = game.board
+    score = 0.0
+    score += sum(row.count(player) for row in board) - sum(row.count(opponent) for row in board)
+    for r, c in [(0, 0), (0, 7), (7, 0), (7, 7)]:
+        if board[r][c] == player:
+            score += 25
+        elif board[r][c] == opponent:
+            score -= 25
+    for i in range(1, 7):
+        for r, c in [(0, i), (7, i), (i, 0), (i, 7)]:
+            if board[r][c] == player:
+                score += 5
+            elif board[r][c] == opponent:
+                score -= 5
+    return score
+
+
+def reference_advanced(game: OthelloGame, player: str) -> float:
+    """Mobilité, frontière, cases X et parité recalculées sur le plateau complet."""
+    opponent = 'W' if player == 'B' else 'B'
+    board = game.board
+    score = reference_simple(game, player)
+    score += 2 * (len(game.get_valid_moves(player)) - len(game.get_valid_moves(opponent)))
+    p_frontier, o_frontier = 0, 0
+    for r in range(8):
+        for c in range(8):
+            if board[r][c] != ' ':
+                continue
+            for dr in [-1, 0, 1]:
+                for dc in [-1, 0, 1]:
+                    nr, nc = r + dr, c + dc
+                    if (dr or dc) and game.is_on_board(nr, nc):
+                        if board[nr][nc] == player:
+                            p_frontier += 1
+                        elif board[nr][nc] == opponent:
+                            o_frontier += 1
+    score += o_frontier - p_frontier
+    x_squares = [(0, 1), (1, 0), (1, 1), (0, 6), (1, 6), (1, 7),
+                 (6, 0), (6, 1), (7, 1), (6, 6), (6, 7), (7, 6)]
+    for r, c in x_squares:
+        corner = (0 if r <= 1 else 7, 0 if c <= 1 else 7)
+        if board[corner[0]][corner[1]] != ' ':
+            continue
+        if board[r][c] == player:
+            score -= 15
+        elif board[r][c] == opponent:
+            score += 15
+    empty_count = sum(row.count(' ') for row in board)
+    if empty_count <= 8:
+        if empty_count % 2 == 1 and game.current_player == player:
+            score += 10
+        elif empty_count % 2 == 0 and game.current_player == opponent:
+            score += 10
+    return score
+
+
+def features_match(game: OthelloGame) -> bool:
+    """Compare les compteurs incrémentaux de `game` à un recalcul complet du plateau."""
+    ref = BoardFeatures()
+    ref.recompute(game.board)
+    return vars(ref) == vars(game.features)
+
+
+def verify(num_games: int = 300, seed: int = 1):
+    """Joue des parties aléatoires puis les annule ; renvoie (positions, liste d'erreurs)."""
+    rng = random.Random(seed)
+    positions, errors = [], []
+    for g in range(num_games):
+        game = OthelloGame()
+        while not game.game_over:
+            moves = game.get_valid_moves()
+            if not moves:
+                game.current_player = game.get_opponent()
+                continue
+            game.place_disc(*rng.choice(moves))
+            positions.append(game.clone())
+            if not features_match(game):
+                errors.append(f"partie {g}: compteurs faux après place_disc {game.last_move}")
+        # Annulation jusqu'à la position initiale
+        while game.undo_move():
+            if not features_match(game):
+                errors.append(f"partie {g}: compteurs faux après undo_move")
+        if game.board != OthelloGame().board or game.current_player != 'B':
+            errors.append(f"partie {g}: l'annulation ne revient pas à la position initiale")
+
+    for pos in positions:
+        for player in 'BW':
+            if evaluate_simple(pos, player) != reference_simple(pos, player):
+                errors.append(f"evaluate_simple diffère ({player})")
+            if evaluate_advanced(pos, player) != reference_advanced(pos, player):
+                errors.append(f"evaluate_advanced diffère ({player})")
+    return positions, errors
+
+
+if __name__ == '__main__':
+    positions, errors = verify()
+    print(f"{len(positions)} positions vérifiées, {len(errors)} erreur(s)")
+    for err in errors[:20]:
+        print(" !", err)
+    for name, fast, ref in (("simple", evaluate_simple, reference_simple),
+                            ("avancée", evaluate_advanced, reference_advanced)):
+        t0 = time.perf_counter()
+        for pos in positions:
+            ref(pos, 'B')
+        t1 = time.perf_counter()
+        for pos in positions:
+            fast(pos, 'B')
+        t2 = time.perf_counter()
+        n = len(positions)
+        print(f"Évaluation {name}: {(t1 - t0) / n * 1e6:.1f} µs -> {(t2 - t1) / n * 1e6:.1f} µs par position")
+    sys.exit(1 if errors else 0)